@@ -36,6 +36,7 @@ class CSVToJSONConverter:
         self.start_time = None
         self.end_time = None
         self.conversion_stats = {}
+        self.transformation_summary = None
     
     def run_conversion(self, validate_data: Optional[bool] = None) -> Dict[str, Any]:
         """
@@ -156,8 +157,9 @@ class CSVToJSONConverter:
             if not transformed_data:
                 raise ValueError("No data was successfully transformed")
             
-            # Log transformation summary
+            # Log transformation summary (kept for the final results)
             summary = self.data_transformer.get_transformation_summary()
+            self.transformation_summary = summary
             logger.info(f"Transformation completed: {summary['tables_transformed']} tables, "
                        f"{summary['total_records']:,} records")
             
@@ -204,6 +206,8 @@ class CSVToJSONConverter:
     def _compile_results(self, raw_data, validation_results, transformed_data, write_results) -> Dict[str, Any]:
         """Compile final conversion results."""
         duration = (self.end_time - self.start_time).total_seconds()
+        total_rows_read = sum(len(df) for df in raw_data.values())
+        total_rows_transformed = sum(len(data['data']) for data in transformed_data.values())
         
         results = {
             'success': True,
@@ -212,23 +216,21 @@ class CSVToJSONConverter:
             'duration_seconds': duration,
             'summary': {
                 'tables_processed': len(raw_data),
-                'total_rows_read': sum(len(df) for df in raw_data.values()),
-                'total_rows_transformed': sum(
-                    len(data['data']) for data in transformed_data.values()
-                ),
+                'total_rows_read': total_rows_read,
+                'total_rows_transformed': total_rows_transformed,
                 'files_written': len(write_results.get('individual_files', {})),
                 'combined_file_created': 'combined_file' in write_results
             },
             'phases': {
                 'reading': {
                     'tables_read': len(raw_data),
-                    'total_rows': sum(len(df) for df in raw_data.values())
+                    'total_rows': total_rows_read
                 },
                 'validation': {
                     'enabled': bool(validation_results),
                     'results': validation_results
                 },
-                'transformation': self.data_transformer.get_transformation_summary(),
+                'transformation': self.transformation_summary,
                 'writing': self.json_writer.get_write_summary()
             },
             'output_files': write_results
@@ -5,12 +5,15 @@ This module provides functionality to transform and prepare data
 for JSON output during the CSV to JSON conversion process.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import pyarrow as pa
 import json
 from datetime import datetime
+from src.utils.config import config_manager
 from src.utils.logger import get_logger
-from src.readers.schema_reader import schema_reader
+from src.readers.schema_reader import schema_reader, DTYPE_NAMES
 
 logger = get_logger(__name__)
 
@@ -20,31 +23,41 @@ class DataTransformer:
     
     def __init__(self):
         """Initialize DataTransformer."""
+        self.config = config_manager
         self.schema_reader = schema_reader
         self.transformation_stats = {}
+        self._compiled = {}
     
-    def transform_dataframe(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
+    def transform_dataframe(self, df: pd.DataFrame, table_name: str,
+                            now_iso: Optional[str] = None,
+                            emit_stats: Optional[bool] = None) -> Dict[str, Any]:
         """
         Transform DataFrame to JSON-ready format.
         
         Args:
             df: DataFrame to transform
             table_name: Name of the table for context
+            now_iso: Optional ISO timestamp shared by a transformation batch.
+                If None, the current time is used
+            emit_stats: Whether to include column statistics in the metadata.
+                If None, uses the processing.emit_statistics setting
             
         Returns:
             Dictionary containing transformed data ready for JSON output
         """
-        logger.info(f"Transforming {len(df)} rows for table {table_name}")
+        logger.info("Transforming %s rows for table %s", len(df), table_name)
         
         try:
-            # Clean and prepare data
-            df_clean = self._clean_dataframe(df, table_name)
+            if now_iso is None:
+                now_iso = datetime.now().isoformat()
             
-            # Convert to records format
-            records = self._convert_to_records(df_clean, table_name)
+            if emit_stats is None:
+                emit_stats = self.config.get_setting('processing.emit_statistics', True)
             
-            # Add metadata
-            metadata = self._generate_metadata(df_clean, table_name)
+            # Clean, convert to records and add metadata with the table's
+            # specialized transform, compiled on first use
+            transform = self._compiled.get(table_name) or self._compile(table_name)
+            records, metadata = transform(df, now_iso, emit_stats)
             
             # Prepare final output structure
             result = {
@@ -57,48 +70,111 @@ class DataTransformer:
                 'original_rows': len(df),
                 'transformed_rows': len(records),
                 'columns': list(df.columns),
-                'transformation_time': datetime.now().isoformat()
+                'transformation_time': now_iso
             }
             
-            logger.info(f"Successfully transformed {table_name}: {len(records)} records")
+            logger.info("Successfully transformed %s: %s records", table_name, len(records))
             return result
             
         except Exception as e:
-            logger.error(f"Failed to transform {table_name}: {e}")
+            logger.error("Failed to transform %s: %s", table_name, e)
             raise
     
-    def _clean_dataframe(self, df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    def _compile(self, table_name: str) -> Callable[[pd.DataFrame, str, bool], Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Build and cache a transform function specialized for a table's schema.
+        
+        The column kinds are derived from the schema once, so repeated transforms
+        of the table skip dtype introspection. DataFrames whose columns do not
+        match the schema fall back to inspecting their dtypes.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Function taking the table DataFrame, a timestamp and whether to emit
+            statistics, returning the table records and metadata
+        """
+        schema_columns = None
+        schema_kinds = None
+        
+        if table_name in self.schema_reader.get_available_tables():
+            schema_columns = self.schema_reader.get_column_names(table_name)
+            columns_by_type = self.schema_reader.get_columns_by_type(table_name)
+            schema_kinds = {
+                'int': columns_by_type['int64'],
+                'float': columns_by_type['float64'],
+                'string': columns_by_type['string']
+            }
+        
+        def transform(df: pd.DataFrame, now_iso: str,
+                      emit_stats: bool) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            if schema_kinds is not None and df.columns.tolist() == schema_columns:
+                column_kinds = schema_kinds
+            else:
+                column_kinds = self._get_column_kinds(df)
+            
+            # Clean and prepare data
+            df_clean = self._clean_dataframe(df, table_name, column_kinds)
+            
+            # Convert to records format
+            records = self._convert_to_records(df_clean, table_name)
+            
+            # Add metadata
+            metadata = self._generate_metadata(df_clean, table_name, column_kinds, now_iso, emit_stats)
+            
+            return records, metadata
+        
+        self._compiled[table_name] = transform
+        return transform
+    
+    def _get_column_kinds(self, df: pd.DataFrame) -> Dict[str, List[str]]:
+        """
+        Group DataFrame columns by data type kind in a single pass over the dtypes.
+        
+        Args:
+            df: DataFrame to inspect
+            
+        Returns:
+            Dictionary with 'int', 'float' and 'string' column name lists
+        """
+        column_kinds = {'int': [], 'float': [], 'string': []}
+        
+        for col, dtype in df.dtypes.items():
+            if dtype.kind in 'iu':
+                column_kinds['int'].append(col)
+            elif dtype.kind == 'f':
+                column_kinds['float'].append(col)
+            elif dtype.kind in 'OSU':
+                column_kinds['string'].append(col)
+        
+        return column_kinds
+    
+    def _clean_dataframe(self, df: pd.DataFrame, table_name: str,
+                         column_kinds: Dict[str, List[str]]) -> pd.DataFrame:
         """
         Clean DataFrame by handling missing values and data type issues.
         
         Args:
             df: DataFrame to clean
             table_name: Name of the table for schema reference
+            column_kinds: Column names grouped by dtype kind
             
         Returns:
             Cleaned DataFrame
         """
-        df_clean = df.copy()
-        
-        # Handle nullable integers (convert NaN to None for JSON)
-        int_columns = df_clean.select_dtypes(include=['Int64']).columns
-        for col in int_columns:
-            # Convert pandas NA to None for JSON serialization
-            df_clean[col] = df_clean[col].where(df_clean[col].notna(), None)
-        
-        # Handle string columns (convert NaN to None)
-        string_columns = df_clean.select_dtypes(include=['string', 'object']).columns
-        for col in string_columns:
-            df_clean[col] = df_clean[col].where(df_clean[col].notna(), None)
-            # Also convert empty strings to None if appropriate
-            df_clean[col] = df_clean[col].where(df_clean[col] != '', None)
-        
-        # Handle float columns (keep NaN as None for JSON)
-        float_columns = df_clean.select_dtypes(include=['float64']).columns
-        for col in float_columns:
-            df_clean[col] = df_clean[col].where(df_clean[col].notna(), None)
-        
-        logger.debug(f"Cleaned {table_name}: handled nulls in {len(df_clean.columns)} columns")
+        # Missing values are not rewritten here: Arrow turns NA/NaN into None when
+        # the records are built, and metadata counts nulls with a single isna()
+        # pass, so no per-cell null check over the whole frame is needed
+        df_clean = df
+        
+        # Convert empty strings to None in string columns (replace() returns a
+        # new frame, so the caller's DataFrame is left untouched)
+        string_columns = column_kinds['string']
+        if string_columns:
+            df_clean = df.replace(dict.fromkeys(string_columns, ''), None)
+        
+        logger.debug("Cleaned %s: handled nulls in %s columns", table_name, len(df_clean.columns))
         return df_clean
     
     def _convert_to_records(self, df: pd.DataFrame, table_name: str) -> List[Dict[str, Any]]:
@@ -112,74 +188,97 @@ class DataTransformer:
         Returns:
             List of record dictionaries
         """
-        # Convert to records, handling pandas-specific types
-        records = []
-        
-        for _, row in df.iterrows():
-            record = {}
-            for col_name, value in row.items():
-                # Handle pandas-specific types for JSON serialization
-                if pd.isna(value):
-                    record[col_name] = None
-                elif isinstance(value, (pd.Int64Dtype, pd.StringDtype)):
-                    record[col_name] = None if pd.isna(value) else value
-                else:
-                    # Convert pandas types to native Python types
-                    if hasattr(value, 'item'):  # numpy/pandas scalars
-                        record[col_name] = value.item()
-                    else:
-                        record[col_name] = value
-            
-            records.append(record)
+        # Build the records from Arrow's contiguous column buffers; Arrow maps
+        # pandas NA/NaN to null, which becomes None in the Python records
+        records = pa.Table.from_pandas(df, preserve_index=False).to_pylist()
         
-        logger.debug(f"Converted {table_name} to {len(records)} records")
+        logger.debug("Converted %s to %s records", table_name, len(records))
         return records
     
-    def _generate_metadata(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
+    def _generate_metadata(self, df: pd.DataFrame, table_name: str,
+                           column_kinds: Dict[str, List[str]],
+                           now_iso: Optional[str] = None,
+                           emit_stats: bool = True) -> Dict[str, Any]:
         """
         Generate metadata for the transformed data.
         
         Args:
             df: DataFrame
             table_name: Name of the table
+            column_kinds: Column names grouped by dtype kind
+            now_iso: Optional ISO timestamp for 'generated_at'. If None, the current time is used
+            emit_stats: Whether to compute column statistics. If False, only the
+                shape and data type information is returned
             
         Returns:
             Metadata dictionary
         """
+        columns = df.columns.tolist()
+        
         # Calculate basic statistics
         metadata = {
             'table_name': table_name,
             'record_count': len(df),
-            'column_count': len(df.columns),
-            'columns': list(df.columns),
-            'generated_at': datetime.now().isoformat(),
-            'data_types': {},
-            'statistics': {}
+            'column_count': len(columns),
+            'columns': columns,
+            'generated_at': now_iso or datetime.now().isoformat(),
+            'data_types': {}
         }
         
-        # Add data type information
-        for col in df.columns:
-            metadata['data_types'][col] = str(df[col].dtype)
+        # Add data type information, under the published names for schema dtypes
+        for col, dtype in zip(columns, df.dtypes):
+            dtype_name = str(dtype)
+            metadata['data_types'][col] = DTYPE_NAMES.get(dtype_name, dtype_name)
+        
+        # Skip the statistics scans entirely when they are not wanted
+        if not emit_stats:
+            return metadata
+        
+        metadata['statistics'] = {}
+        
+        # Compute all statistics up front: one aggregation pass over the
+        # numeric columns and one null-count pass over every column
+        integer_columns = set(column_kinds['int'])
+        float_columns = set(column_kinds['float'])
+        numeric_columns = [col for col in columns
+                           if col in integer_columns or col in float_columns]
+        null_counts = df.isna().sum().to_dict()
+        if numeric_columns:
+            stats_df = df[numeric_columns].agg(['min', 'max', 'mean'])
         
         # Add basic statistics for numeric columns
-        numeric_columns = df.select_dtypes(include=['int64', 'Int64', 'float64']).columns
+        row_count = len(df)
         for col in numeric_columns:
-            if not df[col].isna().all():  # Only if column has data
+            if null_counts[col] < row_count:  # Only if column has data
+                is_integer = col in integer_columns
                 metadata['statistics'][col] = {
-                    'min': df[col].min() if not pd.isna(df[col].min()) else None,
-                    'max': df[col].max() if not pd.isna(df[col].max()) else None,
-                    'mean': df[col].mean() if not pd.isna(df[col].mean()) else None,
-                    'null_count': int(df[col].isna().sum())
+                    'min': self._stat_value(stats_df.at['min', col], is_integer),
+                    'max': self._stat_value(stats_df.at['max', col], is_integer),
+                    'mean': self._stat_value(stats_df.at['mean', col])
                 }
         
         # Add null count for all columns
-        for col in df.columns:
-            if col not in metadata['statistics']:
-                metadata['statistics'][col] = {}
-            metadata['statistics'][col]['null_count'] = int(df[col].isna().sum())
+        for col, null_count in null_counts.items():
+            metadata['statistics'].setdefault(col, {})['null_count'] = int(null_count)
         
         return metadata
     
+    def _stat_value(self, value: Any, is_integer: bool = False) -> Any:
+        """
+        Convert an aggregated statistic to a JSON-friendly value.
+        
+        Args:
+            value: Value taken from the aggregation result
+            is_integer: Whether the source column has an integer dtype
+            
+        Returns:
+            None for missing values, otherwise the value (as int for integer columns,
+            since aggregating mixed columns upcasts them to float)
+        """
+        if pd.isna(value):
+            return None
+        return int(value) if is_integer else value
+    
     def transform_all_tables(self, data_dict: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
         """
         Transform all tables in the data dictionary.
@@ -192,20 +291,60 @@ class DataTransformer:
         """
         transformed_data = {}
         
-        logger.info(f"Transforming {len(data_dict)} tables")
+        # One timestamp for the whole batch instead of a clock read per table
+        now_iso = datetime.now().isoformat()
+        
+        logger.info("Transforming %s tables", len(data_dict))
         
-        for table_name, df in data_dict.items():
-            try:
-                transformed_data[table_name] = self.transform_dataframe(df, table_name)
-                logger.info(f"✅ Successfully transformed {table_name}")
-            except Exception as e:
-                logger.error(f"❌ Failed to transform {table_name}: {e}")
-                # Continue with other tables
-                continue
+        max_workers = self._get_max_workers(len(data_dict))
+        if max_workers > 1:
+            # Tables are independent, so transform them in separate processes
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    table_name: executor.submit(_transform_table, df, table_name, now_iso)
+                    for table_name, df in data_dict.items()
+                }
+                
+                for table_name, future in futures.items():
+                    try:
+                        result, stats = future.result()
+                        transformed_data[table_name] = result
+                        self.transformation_stats[table_name] = stats
+                        logger.info("✅ Successfully transformed %s", table_name)
+                    except Exception as e:
+                        logger.error("❌ Failed to transform %s: %s", table_name, e)
+                        # Continue with other tables
+                        continue
+        else:
+            for table_name, df in data_dict.items():
+                try:
+                    transformed_data[table_name] = self.transform_dataframe(df, table_name, now_iso)
+                    logger.info("✅ Successfully transformed %s", table_name)
+                except Exception as e:
+                    logger.error("❌ Failed to transform %s: %s", table_name, e)
+                    # Continue with other tables
+                    continue
         
-        logger.info(f"Successfully transformed {len(transformed_data)} out of {len(data_dict)} tables")
+        logger.info("Successfully transformed %s out of %s tables", len(transformed_data), len(data_dict))
         return transformed_data
     
+    def _get_max_workers(self, table_count: int) -> int:
+        """
+        Get the number of worker processes to use for transformation.
+        
+        Tables are transformed in-process unless processing.transform_workers asks
+        for more: shipping each DataFrame to a worker and its records back
+        costs about as much as transforming it.
+        
+        Args:
+            table_count: Number of tables to transform
+            
+        Returns:
+            Worker count, capped at the number of tables
+        """
+        max_workers = self.config.get_setting('processing.transform_workers') or 1
+        return max(1, min(max_workers, table_count))
+    
     def get_transformation_summary(self) -> Dict[str, Any]:
         """
         Get summary of transformation statistics.
@@ -267,9 +406,26 @@ class DataTransformer:
                 'columns': table_data['metadata']['columns']
             }
         
-        logger.info(f"Combined dataset created with {combined['metadata']['total_records']} total records")
+        logger.info("Combined dataset created with %s total records", combined['metadata']['total_records'])
         return combined
 
 
+def _transform_table(df: pd.DataFrame, table_name: str, now_iso: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Transform a single table in a worker process.
+    
+    Args:
+        df: DataFrame to transform
+        table_name: Name of the table
+        now_iso: ISO timestamp shared by the transformation batch
+        
+    Returns:
+        Tuple of transformed table data and its transformation stats, which
+        are merged back into the parent process transformer
+    """
+    result = data_transformer.transform_dataframe(df, table_name, now_iso)
+    return result, data_transformer.transformation_stats[table_name]
+
+
 # Global instance for easy access
 data_transformer = DataTransformer() 
\ No newline at end of file
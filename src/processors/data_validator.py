@@ -5,13 +5,35 @@ This module provides functionality to validate data integrity and completeness
 during the CSV to JSON conversion process.
 """
 
-from typing import Dict, Any, List, Tuple
+import sys
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Tuple, FrozenSet
 import pandas as pd
 from src.utils.logger import get_logger
 from src.readers.schema_reader import schema_reader
 
 logger = get_logger(__name__)
 
+# Actual dtype names (without parameters) accepted for each expected schema dtype
+TYPE_COMPATIBILITY = {
+    'int64[pyarrow]': frozenset({'int64', 'Int64'}),
+    'double[pyarrow]': frozenset({'double', 'float64', 'float32'}),
+    'large_string[pyarrow]': frozenset({'large_string', 'string', 'object'})
+}
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Validation outcome for a single table."""
+    
+    table_name: str
+    total_rows: int = 0
+    valid_rows: int = 0
+    issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    data_quality_score: float = 0.0
+
 
 class DataValidator:
     """Handles validation of data integrity and completeness."""
@@ -20,6 +42,7 @@ class DataValidator:
         """Initialize DataValidator."""
         self.schema_reader = schema_reader
         self.validation_results = {}
+        self._running = {}
     
     def validate_dataframe(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
         """
@@ -32,142 +55,217 @@ class DataValidator:
         Returns:
             Dictionary containing validation results
         """
-        logger.info(f"Starting validation for table {table_name}")
-        
-        results = {
-            'table_name': table_name,
-            'total_rows': len(df),
-            'valid_rows': 0,
-            'issues': [],
-            'warnings': [],
-            'errors': [],
-            'data_quality_score': 0.0
-        }
+        logger.info("Starting validation for table %s", table_name)
+        
+        # A whole DataFrame is validated as a single chunk
+        self._running.pop(table_name, None)
+        
+        try:
+            self.update(df, table_name)
+        except Exception as e:
+            logger.error("Validation failed for %s: %s", table_name, e)
+            self._running.pop(table_name, None)
+            results = ValidationResult(table_name, total_rows=len(df))
+            results.errors.append(f"Validation process failed: {e}")
+            self.validation_results[table_name] = results
+            return asdict(results)
+        
+        return self.finalize(table_name)
+    
+    def update(self, chunk: pd.DataFrame, table_name: str):
+        """
+        Accumulate validation counts for one chunk of a table.
+        
+        Chunks of a table are passed in order; call finalize() after the last
+        one to produce the table's results. Only running counts are kept, so
+        memory use is bounded by the chunk size.
+        
+        Args:
+            chunk: DataFrame holding the next rows of the table
+            table_name: Name of the table for schema reference
+        """
+        state = self._running.get(table_name)
+        
+        if state is None:
+            # Structure and dtypes are the same for every chunk, so an empty
+            # slice of the first one is enough for the type checks
+            state = {
+                'sample': chunk.iloc[:0],
+                'columns': frozenset(chunk.columns),
+                'total_rows': 0,
+                'complete_rows': 0,
+                'null_counts': {},
+                'negative_counts': {},
+                'empty_counts': {}
+            }
+            self._running[table_name] = state
+        
+        actual_columns = state['columns']
+        
+        # Count nulls for every column in one pass
+        null_counts = chunk.isna().sum()
+        negative_counts, empty_counts = self._count_range_values(chunk, table_name, actual_columns)
+        
+        state['total_rows'] += len(chunk)
+        state['complete_rows'] += self._count_complete_rows(chunk, table_name, actual_columns)
+        self._add_counts(state['null_counts'], null_counts)
+        self._add_counts(state['negative_counts'], negative_counts)
+        self._add_counts(state['empty_counts'], empty_counts)
+    
+    def finalize(self, table_name: str) -> Dict[str, Any]:
+        """
+        Produce validation results from the counts accumulated by update().
+        
+        Args:
+            table_name: Name of the table for schema reference
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        state = self._running.pop(table_name)
+        results = ValidationResult(table_name, total_rows=state['total_rows'])
         
         try:
+            actual_columns = state['columns']
+            
             # 1. Validate required columns exist
-            self._validate_required_columns(df, table_name, results)
+            self._validate_required_columns(table_name, results, actual_columns)
             
             # 2. Validate data types
-            self._validate_data_types(df, table_name, results)
+            self._validate_data_types(state['sample'], table_name, results, actual_columns)
             
             # 3. Validate required fields are not null
-            self._validate_required_fields(df, table_name, results)
+            self._validate_required_fields(table_name, results, actual_columns, state['null_counts'])
             
             # 4. Validate data ranges and formats
-            self._validate_data_ranges(df, table_name, results)
+            self._validate_data_ranges(table_name, results, state['negative_counts'], state['empty_counts'])
             
             # 5. Calculate data quality score
-            results['data_quality_score'] = self._calculate_quality_score(results)
+            results.data_quality_score = self._calculate_quality_score(results)
             
-            # 6. Determine valid rows count
-            results['valid_rows'] = self._count_valid_rows(df, table_name, results)
+            # 6. Determine valid rows count; if there are structural errors, we
+            # can't determine valid rows reliably
+            results.valid_rows = 0 if results.errors else state['complete_rows']
             
-            logger.info(f"Validation completed for {table_name}: "
-                       f"Quality score: {results['data_quality_score']:.2f}")
+            logger.info("Validation completed for %s: Quality score: %.2f",
+                        table_name, results.data_quality_score)
             
         except Exception as e:
-            logger.error(f"Validation failed for {table_name}: {e}")
-            results['errors'].append(f"Validation process failed: {e}")
+            logger.error("Validation failed for %s: %s", table_name, e)
+            results.errors.append(f"Validation process failed: {e}")
         
         self.validation_results[table_name] = results
-        return results
+        return asdict(results)
+    
+    def _add_counts(self, totals: Dict[str, int], counts: pd.Series):
+        """Add per-column counts from one chunk to running totals."""
+        for col_name, count in counts.items():
+            totals[col_name] = totals.get(col_name, 0) + int(count)
     
-    def _validate_required_columns(self, df: pd.DataFrame, table_name: str, results: Dict[str, Any]):
+    def _validate_required_columns(self, table_name: str, results: ValidationResult,
+                                   actual_columns: FrozenSet[str]):
         """Validate that all required columns are present."""
-        expected_columns = set(self.schema_reader.get_column_names(table_name))
-        actual_columns = set(df.columns)
+        expected_columns = self.schema_reader.get_expected_set(table_name)
         
         missing_columns = expected_columns - actual_columns
         extra_columns = actual_columns - expected_columns
         
         if missing_columns:
             error_msg = f"Missing required columns: {list(missing_columns)}"
-            results['errors'].append(error_msg)
-            logger.error(f"{table_name}: {error_msg}")
+            results.errors.append(error_msg)
+            logger.error("%s: %s", table_name, error_msg)
         
         if extra_columns:
             warning_msg = f"Extra columns found: {list(extra_columns)}"
-            results['warnings'].append(warning_msg)
-            logger.warning(f"{table_name}: {warning_msg}")
+            results.warnings.append(warning_msg)
+            logger.warning("%s: %s", table_name, warning_msg)
     
-    def _validate_data_types(self, df: pd.DataFrame, table_name: str, results: Dict[str, Any]):
+    def _validate_data_types(self, df: pd.DataFrame, table_name: str, results: ValidationResult,
+                             actual_columns: FrozenSet[str]):
         """Validate that data types match schema expectations."""
         expected_dtypes = self.schema_reader.get_pandas_dtypes(table_name)
         
         for col_name, expected_dtype in expected_dtypes.items():
-            if col_name in df.columns:
+            if col_name in actual_columns:
                 actual_dtype = str(df[col_name].dtype)
                 
                 # Check for type compatibility
-                if not self._types_compatible(actual_dtype, expected_dtype):
+                if not self._types_compatible(actual_dtype, str(expected_dtype)):
                     issue_msg = f"Column {col_name}: expected {expected_dtype}, got {actual_dtype}"
-                    results['issues'].append(issue_msg)
-                    logger.warning(f"{table_name}: {issue_msg}")
+                    results.issues.append(issue_msg)
+                    logger.warning("%s: %s", table_name, issue_msg)
     
-    def _validate_required_fields(self, df: pd.DataFrame, table_name: str, results: Dict[str, Any]):
+    def _validate_required_fields(self, table_name: str, results: ValidationResult,
+                                  actual_columns: FrozenSet[str], null_counts: Dict[str, int]):
         """Validate that required fields are not null."""
         required_columns = self.schema_reader.get_required_columns(table_name)
         
         for col_name in required_columns:
-            if col_name in df.columns:
-                null_count = df[col_name].isnull().sum()
+            if col_name in actual_columns:
+                null_count = null_counts[col_name]
                 if null_count > 0:
                     error_msg = f"Column {col_name}: {null_count} null values in required field"
-                    results['errors'].append(error_msg)
-                    logger.error(f"{table_name}: {error_msg}")
+                    results.errors.append(error_msg)
+                    logger.error("%s: %s", table_name, error_msg)
+    
+    def _count_range_values(self, df: pd.DataFrame, table_name: str,
+                            actual_columns: FrozenSet[str]) -> Tuple[pd.Series, pd.Series]:
+        """Count negative ID/price values and empty strings per checked column."""
+        
+        # Column types and ID/price classification come from the schema, so no
+        # dtype introspection or suffix matching is needed
+        columns_by_type = self.schema_reader.get_columns_by_type(table_name)
+        classified = self.schema_reader.get_classified(table_name)
+        id_columns = classified['id']
+        price_columns = classified['price']
+        
+        # Numeric columns are checked for reasonable ranges: ID fields should be
+        # positive and price fields non-negative
+        numeric_columns = columns_by_type['int64'] + columns_by_type['float64']
+        range_columns = [
+            col_name for col_name in numeric_columns
+            if (col_name in id_columns or col_name in price_columns) and col_name in actual_columns
+        ]
+        
+        # String columns are checked for empty values
+        string_columns = [col_name for col_name in columns_by_type['string'] if col_name in actual_columns]
+        
+        # Count negatives and empty strings for all checked columns at once
+        # instead of one comparison and reduction per column
+        negative_counts = (df[range_columns] < 0).sum() if range_columns else pd.Series(dtype='int64')
+        empty_counts = (df[string_columns] == '').sum() if string_columns else pd.Series(dtype='int64')
+        
+        return negative_counts, empty_counts
     
-    def _validate_data_ranges(self, df: pd.DataFrame, table_name: str, results: Dict[str, Any]):
+    def _validate_data_ranges(self, table_name: str, results: ValidationResult,
+                              negative_counts: Dict[str, int], empty_counts: Dict[str, int]):
         """Validate data ranges and formats."""
+        id_columns = self.schema_reader.get_classified(table_name)['id']
         
-        # Validate numeric columns for reasonable ranges
-        numeric_columns = df.select_dtypes(include=['int64', 'Int64', 'float64']).columns
-        
-        for col_name in numeric_columns:
-            if col_name.endswith('_id'):
-                # ID fields should be positive
-                negative_ids = (df[col_name] < 0).sum()
-                if negative_ids > 0:
-                    issue_msg = f"Column {col_name}: {negative_ids} negative ID values"
-                    results['issues'].append(issue_msg)
-                    logger.warning(f"{table_name}: {issue_msg}")
-            
-            elif col_name.endswith('_price') or col_name.endswith('_subtotal'):
-                # Price fields should be non-negative
-                negative_prices = (df[col_name] < 0).sum()
-                if negative_prices > 0:
-                    issue_msg = f"Column {col_name}: {negative_prices} negative price values"
-                    results['issues'].append(issue_msg)
-                    logger.warning(f"{table_name}: {issue_msg}")
-        
-        # Validate string columns for empty values
-        string_columns = df.select_dtypes(include=['string', 'object']).columns
-        
-        for col_name in string_columns:
-            empty_strings = (df[col_name] == '').sum()
+        for col_name, negative_count in negative_counts.items():
+            if negative_count > 0:
+                kind = 'ID' if col_name in id_columns else 'price'
+                issue_msg = f"Column {col_name}: {negative_count} negative {kind} values"
+                results.issues.append(issue_msg)
+                logger.warning("%s: %s", table_name, issue_msg)
+        
+        for col_name, empty_strings in empty_counts.items():
             if empty_strings > 0:
                 info_msg = f"Column {col_name}: {empty_strings} empty string values"
-                results['warnings'].append(info_msg)
-                logger.info(f"{table_name}: {info_msg}")
+                results.warnings.append(info_msg)
+                logger.info("%s: %s", table_name, info_msg)
     
     def _types_compatible(self, actual_type: str, expected_type: str) -> bool:
         """Check if actual and expected types are compatible."""
-        # Define type compatibility mapping
-        compatibility = {
-            'Int64': ['int64', 'Int64'],
-            'int64': ['int64', 'Int64'],
-            'float64': ['float64', 'float32'],
-            'string': ['string', 'object']
-        }
-        
-        expected_compatible = compatibility.get(expected_type, [expected_type])
-        return any(actual_type.startswith(comp) for comp in expected_compatible)
+        # Strip parameters such as '[pyarrow]' or '[ns]' before the lookup
+        base_type = actual_type.partition('[')[0]
+        return base_type in TYPE_COMPATIBILITY.get(expected_type, frozenset({expected_type}))
     
-    def _calculate_quality_score(self, results: Dict[str, Any]) -> float:
+    def _calculate_quality_score(self, results: ValidationResult) -> float:
         """Calculate a data quality score based on validation results."""
-        error_count = len(results['errors'])
-        warning_count = len(results['warnings'])
-        issue_count = len(results['issues'])
+        error_count = len(results.errors)
+        warning_count = len(results.warnings)
+        issue_count = len(results.issues)
         
         # Base score starts at 100
         score = 100.0
@@ -180,22 +278,16 @@ class DataValidator:
         # Ensure score doesn't go below 0
         return max(0.0, score)
     
-    def _count_valid_rows(self, df: pd.DataFrame, table_name: str, results: Dict[str, Any]) -> int:
-        """Count rows that pass all validation checks."""
-        if results['errors']:
-            # If there are structural errors, we can't determine valid rows reliably
-            return 0
+    def _count_complete_rows(self, df: pd.DataFrame, table_name: str, actual_columns: FrozenSet[str]) -> int:
+        """Count rows with no nulls in their required fields."""
+        # Reduce the 2-D not-null block in one call instead of AND-ing a mask
+        # per column
+        required_columns = [
+            col_name for col_name in self.schema_reader.get_required_columns(table_name)
+            if col_name in actual_columns
+        ]
         
-        # Start with all rows as potentially valid
-        valid_mask = pd.Series([True] * len(df))
-        
-        # Check required fields are not null
-        required_columns = self.schema_reader.get_required_columns(table_name)
-        for col_name in required_columns:
-            if col_name in df.columns:
-                valid_mask &= df[col_name].notna()
-        
-        return valid_mask.sum()
+        return int(df[required_columns].notna().to_numpy().all(axis=1).sum())
     
     def get_validation_summary(self) -> Dict[str, Any]:
         """
@@ -218,13 +310,13 @@ class DataValidator:
         
         total_score = 0.0
         for table_name, results in self.validation_results.items():
-            total_score += results['data_quality_score']
-            summary['total_rows'] += results['total_rows']
-            summary['total_valid_rows'] += results['valid_rows']
+            total_score += results.data_quality_score
+            summary['total_rows'] += results.total_rows
+            summary['total_valid_rows'] += results.valid_rows
             
-            if results['errors']:
+            if results.errors:
                 summary['tables_with_errors'] += 1
-            if results['warnings']:
+            if results.warnings:
                 summary['tables_with_warnings'] += 1
         
         summary['overall_quality_score'] = total_score / len(self.validation_results)
@@ -235,39 +327,44 @@ class DataValidator:
         """Print a detailed validation report."""
         summary = self.get_validation_summary()
         
-        print("\n" + "=" * 60)
-        print("DATA VALIDATION REPORT")
-        print("=" * 60)
+        # Collect the report and write it once instead of a print() per line
+        lines = []
+        
+        lines.append("\n" + "=" * 60)
+        lines.append("DATA VALIDATION REPORT")
+        lines.append("=" * 60)
         
-        print(f"Tables Validated: {summary['tables_validated']}")
-        print(f"Overall Quality Score: {summary['overall_quality_score']:.2f}/100")
-        print(f"Total Rows: {summary['total_rows']:,}")
-        print(f"Valid Rows: {summary['total_valid_rows']:,}")
-        print(f"Tables with Errors: {summary['tables_with_errors']}")
-        print(f"Tables with Warnings: {summary['tables_with_warnings']}")
+        lines.append(f"Tables Validated: {summary['tables_validated']}")
+        lines.append(f"Overall Quality Score: {summary['overall_quality_score']:.2f}/100")
+        lines.append(f"Total Rows: {summary['total_rows']:,}")
+        lines.append(f"Valid Rows: {summary['total_valid_rows']:,}")
+        lines.append(f"Tables with Errors: {summary['tables_with_errors']}")
+        lines.append(f"Tables with Warnings: {summary['tables_with_warnings']}")
         
-        print("\nPer-Table Results:")
-        print("-" * 60)
+        lines.append("\nPer-Table Results:")
+        lines.append("-" * 60)
         
         for table_name, results in self.validation_results.items():
-            print(f"\n{table_name.upper()}:")
-            print(f"  Rows: {results['total_rows']:,} (Valid: {results['valid_rows']:,})")
-            print(f"  Quality Score: {results['data_quality_score']:.2f}/100")
+            lines.append(f"\n{table_name.upper()}:")
+            lines.append(f"  Rows: {results.total_rows:,} (Valid: {results.valid_rows:,})")
+            lines.append(f"  Quality Score: {results.data_quality_score:.2f}/100")
             
-            if results['errors']:
-                print(f"  ❌ Errors ({len(results['errors'])}):")
-                for error in results['errors']:
-                    print(f"    • {error}")
+            if results.errors:
+                lines.append(f"  ❌ Errors ({len(results.errors)}):")
+                for error in results.errors:
+                    lines.append(f"    • {error}")
             
-            if results['warnings']:
-                print(f"  ⚠️  Warnings ({len(results['warnings'])}):")
-                for warning in results['warnings']:
-                    print(f"    • {warning}")
+            if results.warnings:
+                lines.append(f"  ⚠️  Warnings ({len(results.warnings)}):")
+                for warning in results.warnings:
+                    lines.append(f"    • {warning}")
             
-            if results['issues']:
-                print(f"  ℹ️  Issues ({len(results['issues'])}):")
-                for issue in results['issues']:
-                    print(f"    • {issue}")
+            if results.issues:
+                lines.append(f"  ℹ️  Issues ({len(results.issues)}):")
+                for issue in results.issues:
+                    lines.append(f"    • {issue}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Global instance for easy access
@@ -1,12 +1,18 @@
 """
 CSV reading utilities.
 
-This module provides functionality to read CSV files using Pandas
-with proper data type handling based on schema configuration.
+This module provides functionality to read CSV files using PyArrow's CSV
+parser into Pandas DataFrames with proper data type handling based on
+schema configuration.
 """
 
-from typing import Dict, Any, Optional
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
@@ -14,6 +20,18 @@ from src.readers.schema_reader import schema_reader
 
 logger = get_logger(__name__)
 
+# Values read as null: pandas' default NA markers, which read_csv applied with
+# keep_default_na=True. They include the project's own '', 'NULL', 'null' and
+# 'None' markers
+NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+]
+
+# Bytes read from the start of a file to estimate its row count
+ROW_ESTIMATE_SAMPLE_SIZE = 64 * 1024
+
 
 class CSVReader:
     """Handles reading CSV files with schema-based data types."""
@@ -22,6 +40,7 @@ class CSVReader:
         """Initialize CSVReader."""
         self.config = config_manager
         self.schema_reader = schema_reader
+        self._file_paths = {}
     
     def read_csv_file(self, table_name: str, file_path: Optional[str] = None) -> pd.DataFrame:
         """
@@ -37,7 +56,7 @@ class CSVReader:
         Raises:
             FileNotFoundError: If CSV file is not found
             ValueError: If schema validation fails
-            pd.errors.EmptyDataError: If CSV file is empty
+            pa.ArrowInvalid: If CSV file cannot be parsed
         """
         # Validate schema first
         self.schema_reader.validate_schema(table_name)
@@ -48,45 +67,163 @@ class CSVReader:
         
         file_path = Path(file_path)
         
-        # Check if file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {file_path}")
-        
-        logger.info(f"Reading CSV file: {file_path}")
+        logger.info("Reading CSV file: %s", file_path)
         
         try:
             # Get schema-based configuration
-            dtypes = self.schema_reader.get_pandas_dtypes(table_name)
-            column_names = self.schema_reader.get_column_names(table_name)
+            read_options, parse_options, convert_options = self._get_csv_options(table_name)
             
-            # Read CSV with proper data types
-            df = pd.read_csv(
+            # Parse with PyArrow's multithreaded reader
+            table = pacsv.read_csv(
                 file_path,
-                header=None,  # No header in the CSV files
-                names=column_names,  # Use schema-defined column names
-                dtype=dtypes,  # Use schema-defined data types
-                na_values=['', 'NULL', 'null', 'None'],  # Handle missing values
-                keep_default_na=True
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options
             )
             
-            logger.info(f"Successfully read {len(df)} rows from {table_name}")
-            logger.debug(f"DataFrame info for {table_name}:")
-            logger.debug(f"  Shape: {df.shape}")
-            logger.debug(f"  Columns: {list(df.columns)}")
-            logger.debug(f"  Data types: {dict(df.dtypes)}")
+            # Convert to Arrow-backed columns, releasing Arrow buffers as they
+            # are converted to keep peak memory down
+            df = table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+            del table
+            
+            logger.info("Successfully read %s rows from %s", len(df), table_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Only materialize the column and dtype listings when they are logged
+                logger.debug("DataFrame info for %s:", table_name)
+                logger.debug("  Shape: %s", df.shape)
+                logger.debug("  Columns: %s", list(df.columns))
+                logger.debug("  Data types: %s", dict(df.dtypes))
             
             return df
             
-        except pd.errors.EmptyDataError:
-            logger.error(f"CSV file is empty: {file_path}")
-            raise
-        except pd.errors.ParserError as e:
-            logger.error(f"Error parsing CSV file {file_path}: {e}")
+        except FileNotFoundError:
+            # Opening the file is the existence check
+            raise FileNotFoundError(f"CSV file not found: {file_path}") from None
+        except pa.ArrowInvalid as e:
+            logger.error("Error parsing CSV file %s: %s", file_path, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error reading CSV file {file_path}: {e}")
+            logger.error("Unexpected error reading CSV file %s: %s", file_path, e)
             raise
     
+    def scan_csv_file(self, table_name: str, file_path: Optional[str] = None) -> pacsv.CSVStreamingReader:
+        """
+        Open a CSV file for a specific table as a lazy stream of record batches.
+        
+        The declared schema is passed to the reader, so no inference scan runs and
+        batches can be consumed without materializing the whole table.
+        
+        Args:
+            table_name: Name of the table to read
+            file_path: Optional custom file path. If None, uses config path
+            
+        Returns:
+            PyArrow streaming reader yielding record batches
+            
+        Raises:
+            FileNotFoundError: If CSV file is not found
+            ValueError: If schema validation fails
+        """
+        self.schema_reader.validate_schema(table_name)
+        
+        if file_path is None:
+            file_path = self._get_table_file_path(table_name)
+        
+        file_path = Path(file_path)
+        
+        read_options, parse_options, convert_options = self._get_csv_options(table_name)
+        
+        logger.info("Opening CSV stream: %s", file_path)
+        try:
+            return pacsv.open_csv(
+                file_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {file_path}") from None
+    
+    def iter_chunks(self, table_name: str, chunksize: Optional[int] = None,
+                    file_path: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file for a specific table as a sequence of DataFrame chunks.
+        
+        Only one chunk is held in memory at a time, so tables larger than memory
+        can be validated chunk by chunk (see DataValidator.update/finalize).
+        
+        Args:
+            table_name: Name of the table to read
+            chunksize: Number of rows per chunk (the last chunk may be smaller).
+                If None, uses processing.chunk_size from the config
+            file_path: Optional custom file path. If None, uses config path
+            
+        Yields:
+            DataFrames with proper data types; a file with no rows (but at least
+            a line terminator) yields one empty chunk
+            
+        Raises:
+            FileNotFoundError: If CSV file is not found
+            ValueError: If schema validation fails
+            pa.ArrowInvalid: If CSV file is empty (0 bytes) or cannot be parsed
+        """
+        if chunksize is None:
+            chunksize = self.config.get_setting('processing.chunk_size', 10000)
+        
+        reader = self.scan_csv_file(table_name, file_path)
+        pending = []
+        pending_rows = 0
+        chunks_yielded = 0
+        
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            
+            if pending_rows >= chunksize:
+                table = pa.Table.from_batches(pending)
+                
+                while table.num_rows >= chunksize:
+                    yield table.slice(0, chunksize).to_pandas(types_mapper=pd.ArrowDtype)
+                    chunks_yielded += 1
+                    table = table.slice(chunksize)
+                
+                pending = table.to_batches()
+                pending_rows = table.num_rows
+        
+        if pending_rows or not chunks_yielded:
+            table = pa.Table.from_batches(pending, schema=reader.schema)
+            yield table.to_pandas(types_mapper=pd.ArrowDtype)
+    
+    def _get_csv_options(self, table_name: str) -> Tuple[pacsv.ReadOptions, pacsv.ParseOptions, pacsv.ConvertOptions]:
+        """
+        Build PyArrow CSV options from a table's schema.
+        
+        Declaring every column type up front skips type inference, which would
+        otherwise also turn date-like strings into timestamps.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Tuple of read, parse and convert options
+        """
+        dtypes = self.schema_reader.get_pandas_dtypes(table_name)
+        column_names = self.schema_reader.get_column_names(table_name)
+        
+        read_options = pacsv.ReadOptions(
+            column_names=column_names,  # No header in the CSV files
+            block_size=8 << 20,
+            use_threads=True
+        )
+        parse_options = pacsv.ParseOptions(delimiter=',')
+        convert_options = pacsv.ConvertOptions(
+            column_types={col: dtype.pyarrow_dtype for col, dtype in dtypes.items()},
+            null_values=NULL_VALUES,  # Handle missing values
+            strings_can_be_null=True
+        )
+        
+        return read_options, parse_options, convert_options
+    
     def _get_table_file_path(self, table_name: str) -> str:
         """
         Get the file path for a table based on configuration.
@@ -97,11 +234,16 @@ class CSVReader:
         Returns:
             File path for the table's CSV file
         """
-        base_path = self.config.get_setting('input.base_path', 'data/input/retail_db')
-        file_pattern = self.config.get_setting('input.file_pattern', 'part-00000')
+        file_path = self._file_paths.get(table_name)
         
-        file_path = Path(base_path) / table_name / file_pattern
-        return str(file_path)
+        if file_path is None:
+            base_path = self.config.get_setting('input.base_path', 'data/input/retail_db')
+            file_pattern = self.config.get_setting('input.file_pattern', 'part-00000')
+            
+            file_path = str(Path(base_path) / table_name / file_pattern)
+            self._file_paths[table_name] = file_path
+        
+        return file_path
     
     def get_file_info(self, table_name: str) -> Dict[str, Any]:
         """
@@ -118,24 +260,42 @@ class CSVReader:
         info = {
             'table_name': table_name,
             'file_path': str(file_path),
-            'exists': file_path.exists(),
+            'exists': False,
             'size_bytes': 0,
             'estimated_rows': 0
         }
         
-        if file_path.exists():
-            info['size_bytes'] = file_path.stat().st_size
+        # A single stat call both checks existence and gets the size
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            file_stat = None
+        
+        if file_stat is not None:
+            info['exists'] = True
+            info['size_bytes'] = file_stat.st_size
             
-            # Estimate number of rows by reading first few lines
+            # Estimate number of rows from the mean line length of the first
+            # block instead of scanning the whole file
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = sum(1 for _ in f)
+                with open(file_path, 'rb', buffering=0) as f:
+                    sample = f.read(ROW_ESTIMATE_SAMPLE_SIZE)
+                    newlines = sample.count(b'\n')
+                    
+                    if newlines == 0 or len(sample) < ROW_ESTIMATE_SAMPLE_SIZE:
+                        # Very long lines or a file that fits in the sample:
+                        # count the remaining newlines exactly
+                        for block in iter(lambda: f.read(ROW_ESTIMATE_SAMPLE_SIZE), b''):
+                            newlines += block.count(b'\n')
+                        lines = newlines
+                    else:
+                        lines = int(info['size_bytes'] / (len(sample) / newlines))
                 info['estimated_rows'] = lines
             except Exception as e:
-                logger.warning(f"Could not estimate rows for {table_name}: {e}")
+                logger.warning("Could not estimate rows for %s: %s", table_name, e)
                 info['estimated_rows'] = 'unknown'
         
-        logger.debug(f"File info for {table_name}: {info}")
+        logger.debug("File info for %s: %s", table_name, info)
         return info
     
     def validate_csv_structure(self, table_name: str) -> bool:
@@ -153,9 +313,6 @@ class CSVReader:
         """
         file_path = Path(self._get_table_file_path(table_name))
         
-        if not file_path.exists():
-            raise ValueError(f"CSV file not found: {file_path}")
-        
         try:
             # Read just the first row to check structure
             df_sample = pd.read_csv(file_path, header=None, nrows=1)
@@ -170,11 +327,13 @@ class CSVReader:
                     f"expected {expected_columns}, found {actual_columns}"
                 )
             
-            logger.info(f"CSV structure validation passed for {table_name}")
+            logger.info("CSV structure validation passed for %s", table_name)
             return True
             
+        except FileNotFoundError:
+            raise ValueError(f"CSV file not found: {file_path}") from None
         except Exception as e:
-            logger.error(f"CSV structure validation failed for {table_name}: {e}")
+            logger.error("CSV structure validation failed for %s: %s", table_name, e)
             raise
     
     def read_all_tables(self) -> Dict[str, pd.DataFrame]:
@@ -187,19 +346,30 @@ class CSVReader:
         all_data = {}
         available_tables = self.schema_reader.get_available_tables()
         
-        logger.info(f"Reading {len(available_tables)} tables")
+        logger.info("Reading %s tables", len(available_tables))
         
-        for table_name in available_tables:
-            try:
-                df = self.read_csv_file(table_name)
-                all_data[table_name] = df
-                logger.info(f"✅ Successfully read {table_name}: {len(df)} rows")
-            except Exception as e:
-                logger.error(f"❌ Failed to read {table_name}: {e}")
-                # Continue with other tables
-                continue
+        # PyArrow releases the GIL while parsing, so tables are read on threads
+        max_workers = self.config.get_setting('processing.read_workers') or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(available_tables)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                table_name: executor.submit(self.read_csv_file, table_name)
+                for table_name in available_tables
+            }
+            
+            # Collect in schema order so downstream output order is stable
+            for table_name, future in futures.items():
+                try:
+                    df = future.result()
+                    all_data[table_name] = df
+                    logger.info("✅ Successfully read %s: %s rows", table_name, len(df))
+                except Exception as e:
+                    logger.error("❌ Failed to read %s: %s", table_name, e)
+                    # Continue with other tables
+                    continue
         
-        logger.info(f"Successfully read {len(all_data)} out of {len(available_tables)} tables")
+        logger.info("Successfully read %s out of %s tables", len(all_data), len(available_tables))
         return all_data
 
 
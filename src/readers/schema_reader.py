@@ -5,13 +5,31 @@ This module provides functionality to load and parse schema definitions
 from the configuration files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, FrozenSet
 import pandas as pd
+import pyarrow as pa
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# PyArrow-backed pandas dtypes for each schema type. Arrow columns keep nulls
+# as native nulls and use Arrow compute kernels for comparisons and reductions
+PANDAS_DTYPES = {
+    'int64': pd.ArrowDtype(pa.int64()),
+    'float64': pd.ArrowDtype(pa.float64()),
+    'string': pd.ArrowDtype(pa.large_string())
+}
+
+# Names published in output metadata for the dtypes above. These are the names
+# of the pandas dtypes the columns had before they were Arrow-backed, so the
+# data_types in the output files do not depend on the in-memory backend
+DTYPE_NAMES = {
+    str(PANDAS_DTYPES['int64']): 'Int64',
+    str(PANDAS_DTYPES['float64']): 'float64',
+    str(PANDAS_DTYPES['string']): 'string'
+}
+
 
 class SchemaReader:
     """Handles loading and parsing of data schemas."""
@@ -20,6 +38,7 @@ class SchemaReader:
         """Initialize SchemaReader."""
         self.config = config_manager
         self._table_schemas = None
+        self._precomputed = {}
     
     def load_all_schemas(self) -> Dict[str, Any]:
         """
@@ -32,9 +51,11 @@ class SchemaReader:
             try:
                 schemas = self.config.load_schemas()
                 self._table_schemas = schemas.get('tables', {})
-                logger.info(f"Loaded schemas for {len(self._table_schemas)} tables")
+                # Drop lists derived from previously loaded schemas
+                self._precomputed = {}
+                logger.info("Loaded schemas for %s tables", len(self._table_schemas))
             except Exception as e:
-                logger.error(f"Failed to load schemas: {e}")
+                logger.error("Failed to load schemas: %s", e)
                 raise
                 
         return self._table_schemas
@@ -52,14 +73,16 @@ class SchemaReader:
         Raises:
             KeyError: If table schema not found
         """
-        schemas = self.load_all_schemas()
+        if self._table_schemas is not None:
+            if table_name not in self._table_schemas:
+                raise KeyError(f"Schema not found for table: {table_name}")
+                
+            return self._table_schemas[table_name]
         
-        if table_name not in schemas:
-            raise KeyError(f"Schema not found for table: {table_name}")
-            
-        return schemas[table_name]
+        # Only the requested table's schema is constructed
+        return self.config.get_table_schema(table_name)
     
-    def get_pandas_dtypes(self, table_name: str) -> Dict[str, str]:
+    def get_pandas_dtypes(self, table_name: str) -> Dict[str, pd.ArrowDtype]:
         """
         Get pandas-compatible data types for a table.
         
@@ -67,8 +90,106 @@ class SchemaReader:
             table_name: Name of the table
             
         Returns:
-            Dictionary mapping column names to pandas dtypes
+            Dictionary mapping column names to PyArrow-backed pandas dtypes
+        """
+        return self._get_precomputed(table_name)['dtypes']
+    
+    def get_column_names(self, table_name: str) -> List[str]:
+        """
+        Get ordered list of column names for a table.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            List of column names in position order
+        """
+        return self._get_precomputed(table_name)['columns']
+    
+    def get_expected_set(self, table_name: str) -> FrozenSet[str]:
+        """
+        Get the set of column names defined for a table.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Frozen set of column names, for membership tests and set differences
+        """
+        return self._get_precomputed(table_name)['expected_set']
+    
+    def get_required_columns(self, table_name: str) -> List[str]:
+        """
+        Get list of required columns for a table.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            List of required column names
+        """
+        return self._get_precomputed(table_name)['required']
+    
+    def get_columns_by_type(self, table_name: str) -> Dict[str, List[str]]:
+        """
+        Get column names for a table grouped by schema type.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Dictionary with 'int64', 'float64' and 'string' lists of column names
+            in position order (columns of unknown type are read as strings)
+        """
+        return self._get_precomputed(table_name)['columns_by_type']
+    
+    def get_classified(self, table_name: str) -> Dict[str, FrozenSet[str]]:
+        """
+        Get a table's numeric columns classified by name suffix for range checks.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Dictionary with 'id' (columns ending in _id) and 'price' (columns
+            ending in _price or _subtotal) sets of column names
+        """
+        return self._get_precomputed(table_name)['classified']
+    
+    def _get_precomputed(self, table_name: str) -> Dict[str, Any]:
+        """
+        Get the schema-derived dtypes, column order and required columns for a table.
+        
+        These are called several times per table (CSV read and each validation
+        step), so they are computed once and cached. Callers must not modify
+        the returned objects.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Dictionary with 'dtypes', 'columns', 'expected_set', 'required',
+            'columns_by_type' and 'classified' entries
         """
+        precomputed = self._precomputed.get(table_name)
+        
+        if precomputed is None:
+            column_names = self._compute_column_names(table_name)
+            columns_by_type = self._compute_columns_by_type(table_name, column_names)
+            precomputed = {
+                'dtypes': self._compute_pandas_dtypes(table_name),
+                'columns': column_names,
+                'expected_set': frozenset(column_names),
+                'required': self._compute_required_columns(table_name),
+                'columns_by_type': columns_by_type,
+                'classified': self._compute_classified(columns_by_type)
+            }
+            self._precomputed[table_name] = precomputed
+        
+        return precomputed
+    
+    def _compute_pandas_dtypes(self, table_name: str) -> Dict[str, pd.ArrowDtype]:
+        """Map a table's schema types to pandas dtypes."""
         schema = self.get_table_schema(table_name)
         columns = schema.get('columns', {})
         
@@ -77,29 +198,17 @@ class SchemaReader:
             col_type = col_config.get('type', 'string')
             
             # Map schema types to pandas types
-            if col_type == 'int64':
-                dtypes[col_name] = 'Int64'  # Nullable integer
-            elif col_type == 'float64':
-                dtypes[col_name] = 'float64'
-            elif col_type == 'string':
-                dtypes[col_name] = 'string'
+            if col_type in PANDAS_DTYPES:
+                dtypes[col_name] = PANDAS_DTYPES[col_type]
             else:
-                logger.warning(f"Unknown type '{col_type}' for {col_name}, using string")
-                dtypes[col_name] = 'string'
+                logger.warning("Unknown type '%s' for %s, using string", col_type, col_name)
+                dtypes[col_name] = PANDAS_DTYPES['string']
         
-        logger.debug(f"Generated dtypes for {table_name}: {dtypes}")
+        logger.debug("Generated dtypes for %s: %s", table_name, dtypes)
         return dtypes
     
-    def get_column_names(self, table_name: str) -> List[str]:
-        """
-        Get ordered list of column names for a table.
-        
-        Args:
-            table_name: Name of the table
-            
-        Returns:
-            List of column names in position order
-        """
+    def _compute_column_names(self, table_name: str) -> List[str]:
+        """Sort a table's schema columns by position."""
         schema = self.get_table_schema(table_name)
         columns = schema.get('columns', {})
         
@@ -110,19 +219,11 @@ class SchemaReader:
         )
         
         column_names = [col_name for col_name, _ in sorted_columns]
-        logger.debug(f"Column order for {table_name}: {column_names}")
+        logger.debug("Column order for %s: %s", table_name, column_names)
         return column_names
     
-    def get_required_columns(self, table_name: str) -> List[str]:
-        """
-        Get list of required columns for a table.
-        
-        Args:
-            table_name: Name of the table
-            
-        Returns:
-            List of required column names
-        """
+    def _compute_required_columns(self, table_name: str) -> List[str]:
+        """Collect a table's schema columns marked as required."""
         schema = self.get_table_schema(table_name)
         columns = schema.get('columns', {})
         
@@ -131,9 +232,29 @@ class SchemaReader:
             if col_config.get('required', False)
         ]
         
-        logger.debug(f"Required columns for {table_name}: {required_cols}")
+        logger.debug("Required columns for %s: %s", table_name, required_cols)
         return required_cols
     
+    def _compute_columns_by_type(self, table_name: str, column_names: List[str]) -> Dict[str, List[str]]:
+        """Group a table's columns (in position order) by schema type."""
+        columns = self.get_table_schema(table_name).get('columns', {})
+        
+        columns_by_type = {'int64': [], 'float64': [], 'string': []}
+        for col_name in column_names:
+            col_type = columns[col_name].get('type', 'string')
+            columns_by_type.get(col_type, columns_by_type['string']).append(col_name)
+        
+        return columns_by_type
+    
+    def _compute_classified(self, columns_by_type: Dict[str, List[str]]) -> Dict[str, FrozenSet[str]]:
+        """Classify a table's numeric columns as ID or price columns by suffix."""
+        numeric_columns = columns_by_type['int64'] + columns_by_type['float64']
+        
+        return {
+            'id': frozenset(col for col in numeric_columns if col.endswith('_id')),
+            'price': frozenset(col for col in numeric_columns if col.endswith(('_price', '_subtotal')))
+        }
+    
     def validate_schema(self, table_name: str) -> bool:
         """
         Validate that a table schema is properly configured.
@@ -164,11 +285,11 @@ class SchemaReader:
                 if 'position' not in col_config:
                     raise ValueError(f"Missing position for column {col_name} in table {table_name}")
             
-            logger.info(f"Schema validation passed for table {table_name}")
+            logger.info("Schema validation passed for table %s", table_name)
             return True
             
         except Exception as e:
-            logger.error(f"Schema validation failed for table {table_name}: {e}")
+            logger.error("Schema validation failed for table %s: %s", table_name, e)
             raise
     
     def get_available_tables(self) -> List[str]:
@@ -178,7 +299,10 @@ class SchemaReader:
         Returns:
             List of table names
         """
-        return list(self.load_all_schemas().keys())
+        if self._table_schemas is not None:
+            return list(self._table_schemas.keys())
+        
+        return self.config.get_table_names()
 
 
 # Global instance for easy access
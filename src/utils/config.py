@@ -6,10 +6,17 @@ for the CSV to JSON conversion project.
 """
 
 import yaml
+from yaml.constructor import SafeConstructor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 
 class ConfigManager:
     """Manages application configuration loading and access."""
@@ -23,7 +30,10 @@ class ConfigManager:
         """
         self.config_dir = Path(config_dir)
         self._settings = None
+        self._flat_settings = None
         self._schemas = None
+        self._schema_node = None
+        self._table_schemas = {}
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -44,7 +54,11 @@ class ConfigManager:
                 
             try:
                 with open(settings_file, 'r', encoding='utf-8') as file:
-                    self._settings = yaml.safe_load(file)
+                    self._settings = yaml.load(file, Loader=YAMLLoader)
+                
+                # Index every dotted key path once so lookups are a single dict hit
+                self._flat_settings = {}
+                self._flatten_settings(self._settings, '')
                     
                 logging.info(f"Settings loaded from {settings_file}")
                     
@@ -66,6 +80,28 @@ class ConfigManager:
             yaml.YAMLError: If YAML parsing fails
         """
         if self._schemas is None:
+            schema_node = self._compose_schemas()
+            
+            if schema_node is not None:
+                self._schemas = SafeConstructor().construct_document(schema_node)
+                
+        return self._schemas
+    
+    def _compose_schemas(self) -> Optional[yaml.Node]:
+        """
+        Parse schemas.yaml into a node tree without constructing Python objects.
+        
+        Composing is cheaper than a full load, and lets single table schemas be
+        constructed on demand.
+        
+        Returns:
+            Root YAML node, or None for an empty file
+            
+        Raises:
+            FileNotFoundError: If schemas.yaml is not found
+            yaml.YAMLError: If YAML parsing fails
+        """
+        if self._schema_node is None:
             schemas_file = self.config_dir / "schemas.yaml"
             
             if not schemas_file.exists():
@@ -73,7 +109,7 @@ class ConfigManager:
                 
             try:
                 with open(schemas_file, 'r', encoding='utf-8') as file:
-                    self._schemas = yaml.safe_load(file)
+                    self._schema_node = yaml.compose(file, Loader=YAMLLoader)
                     
                 logging.info(f"Schemas loaded from {schemas_file}")
                     
@@ -81,7 +117,24 @@ class ConfigManager:
                 logging.error(f"Error parsing schemas YAML: {e}")
                 raise
                 
-        return self._schemas
+        return self._schema_node
+    
+    def _get_tables_node(self) -> Optional[yaml.MappingNode]:
+        """
+        Get the node holding the table schemas mapping.
+        
+        Returns:
+            Mapping node for 'tables', or None if the file has an unexpected
+            layout (callers then fall back to a full load)
+        """
+        schema_node = self._compose_schemas()
+        
+        if isinstance(schema_node, yaml.MappingNode):
+            for key_node, value_node in schema_node.value:
+                if key_node.value == 'tables' and isinstance(value_node, yaml.MappingNode):
+                    return value_node
+        
+        return None
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -97,17 +150,24 @@ class ConfigManager:
         Example:
             config.get_setting('input.base_path') -> 'data/input/retail_db'
         """
-        settings = self.load_settings()
-        keys = key_path.split('.')
+        self.load_settings()
+        return self._flat_settings.get(key_path, default)
+    
+    def _flatten_settings(self, settings: Any, prefix: str):
+        """
+        Record a settings value under every dotted key path that reaches it.
         
-        current = settings
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
-                
-        return current
+        Args:
+            settings: Settings mapping (or value) to index
+            prefix: Dotted key path of settings, ending in '.' unless empty
+        """
+        if not isinstance(settings, dict):
+            return
+        
+        for key, value in settings.items():
+            key_path = f"{prefix}{key}"
+            self._flat_settings[key_path] = value
+            self._flatten_settings(value, f"{key_path}.")
     
     def get_table_schema(self, table_name: str) -> Dict[str, Any]:
         """
@@ -122,15 +182,30 @@ class ConfigManager:
         Raises:
             KeyError: If table schema not found
         """
-        schemas = self.load_schemas()
+        if table_name in self._table_schemas:
+            return self._table_schemas[table_name]
         
-        if 'tables' not in schemas:
-            raise KeyError("No tables configuration found in schemas")
+        tables_node = self._get_tables_node()
+        
+        if tables_node is None or self._schemas is not None:
+            schemas = self.load_schemas()
             
-        if table_name not in schemas['tables']:
-            raise KeyError(f"Schema not found for table: {table_name}")
+            if 'tables' not in schemas:
+                raise KeyError("No tables configuration found in schemas")
+                
+            if table_name not in schemas['tables']:
+                raise KeyError(f"Schema not found for table: {table_name}")
+                
+            return schemas['tables'][table_name]
+        
+        # Construct only the requested table's schema
+        for key_node, value_node in tables_node.value:
+            if key_node.value == table_name:
+                table_schema = SafeConstructor().construct_document(value_node)
+                self._table_schemas[table_name] = table_schema
+                return table_schema
             
-        return schemas['tables'][table_name]
+        raise KeyError(f"Schema not found for table: {table_name}")
     
     def get_table_names(self) -> list:
         """
@@ -139,8 +214,13 @@ class ConfigManager:
         Returns:
             List of table names
         """
-        schemas = self.load_schemas()
-        return list(schemas.get('tables', {}).keys())
+        tables_node = self._get_tables_node()
+        
+        if tables_node is None:
+            schemas = self.load_schemas()
+            return list(schemas.get('tables', {}).keys())
+        
+        return [key_node.value for key_node, _ in tables_node.value]
 
 
 # Global instance for easy access
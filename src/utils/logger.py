@@ -5,12 +5,148 @@ This module provides centralized logging configuration for the
 CSV to JSON conversion project.
 """
 
+import atexit
 import logging
 import logging.handlers
+import multiprocessing
+import os
+import queue
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from src.utils.config import config_manager
 
+# Queue shared by every logger. Its records are written by a single background
+# listener that owns the shared console and file handlers
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_listener = None
+
+# Console and file handlers shared by every logger, created on first setup
+_shared_handlers = None
+
+# Loggers that log through the shared handlers
+_shared_loggers = []
+
+# Worker processes log through the shared handlers directly: a listener thread
+# does not survive a fork, and records queued in a spawned worker would only be
+# written if the worker ran its exit handlers
+_log_directly = multiprocessing.parent_process() is not None
+
+# Logging section of the settings, shared by every logger set up
+_SETTINGS_CACHE = None
+
+# Serializes handler setup so concurrent first calls do not both add handlers
+_setup_lock = threading.Lock()
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers log output instead of flushing every record.
+    
+    Records are written through a large buffer and flushed when it fills, for
+    records at or above flush_level, and when the handler is closed. The file
+    size used for rollover is tracked in memory (in characters, so rollover
+    is approximate for non-ASCII output) because asking the stream for its
+    position would flush it.
+    """
+    
+    def __init__(self, *args, buffer_size: int = 64 * 1024, flush_level: int = logging.WARNING, **kwargs):
+        """
+        Initialize BufferedRotatingFileHandler.
+        
+        Args:
+            *args: Positional arguments for RotatingFileHandler
+            buffer_size: Write buffer size in bytes
+            flush_level: Records at or above this level are flushed immediately
+            **kwargs: Keyword arguments for RotatingFileHandler
+        """
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._file_size = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding,
+                      errors=self.errors, buffering=self.buffer_size)
+        self._file_size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Determine if the record would take the file past maxBytes."""
+        if self.maxBytes <= 0:
+            return False
+        
+        msg = self.format(record) + self.terminator
+        return self._file_size + len(msg) >= self.maxBytes
+    
+    def emit(self, record: logging.LogRecord):
+        """Write a record, flushing only when required."""
+        try:
+            msg = self.format(record) + self.terminator
+            
+            if self.maxBytes > 0 and self._file_size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._file_size += len(msg)
+            
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_shared_handlers():
+    """Flush the shared handlers."""
+    for handler in _shared_handlers or ():
+        handler.flush()
+
+
+def _stop_queue_listener():
+    """Stop the listener thread, writing out any records still queued."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _use_direct_handlers():
+    """
+    Attach the shared handlers directly in a forked child process.
+    
+    The listener thread does not survive a fork, so the child logs
+    synchronously instead of queueing records nobody would write. Forked
+    workers exit without running cleanup handlers, so the shared file
+    handler is flushed on every record.
+    """
+    global _queue_listener, _log_directly, _setup_lock
+    
+    _queue_listener = None
+    _log_directly = True
+    # The lock may have been held by another parent thread at fork time
+    _setup_lock = threading.Lock()
+    
+    for logger in _shared_loggers:
+        logger.removeHandler(_queue_handler)
+        for handler in _shared_handlers:
+            logger.addHandler(handler)
+    
+    for handler in _shared_handlers or ():
+        if isinstance(handler, BufferedRotatingFileHandler):
+            handler.flush_level = logging.NOTSET
+
+
+atexit.register(_stop_queue_listener)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_shared_handlers, after_in_child=_use_direct_handlers)
+
 
 def setup_logger(
     name: str = __name__, 
@@ -36,44 +172,132 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    # Load configuration
-    try:
-        settings = config_manager.load_settings()
-        log_config = settings.get('logging', {})
-    except Exception:
-        # Fallback to defaults if config loading fails
-        log_config = {}
-    
-    # Set logging level
-    log_level = level or log_config.get('level', 'INFO')
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Set log format
-    log_format = log_format or log_config.get(
-        'format', 
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    return _configure_logger(logger, level, log_file, log_format)
+
+
+def _get_log_config() -> Dict[str, Any]:
+    """
+    Get the logging section of the settings, loading it once for all loggers.
+    
+    Returns:
+        Logging configuration (empty if settings could not be loaded)
+    """
+    global _SETTINGS_CACHE
+    
+    if _SETTINGS_CACHE is None:
+        try:
+            settings = config_manager.load_settings()
+            _SETTINGS_CACHE = settings.get('logging', {})
+        except Exception:
+            # Fallback to defaults if config loading fails (retried next time)
+            return {}
+    
+    return _SETTINGS_CACHE
+
+
+def _create_handlers(log_file: Optional[str], log_format: str) -> List[logging.Handler]:
+    """
+    Create console and (if a path is given) rotating file handlers.
+    
+    Args:
+        log_file: Log file path, or None for console output only
+        log_format: Log record format
+        
+    Returns:
+        List of handlers
+    """
     formatter = logging.Formatter(log_format)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler
-    log_file_path = log_file or log_config.get('file', 'logs/conversion.log')
-    if log_file_path:
+    if log_file:
         # Ensure log directory exists
-        log_path = Path(log_file_path)
+        log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file_path,
+        # Worker processes may exit without flushing (forkserver workers skip
+        # exit handlers), so they flush every record
+        file_handler = BufferedRotatingFileHandler(
+            log_file,
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            flush_level=logging.NOTSET if _log_directly else logging.WARNING
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    return handlers
+
+
+def _configure_logger(
+    logger: logging.Logger,
+    level: Optional[str] = None,
+    log_file: Optional[str] = None,
+    log_format: Optional[str] = None
+) -> logging.Logger:
+    """
+    Attach handlers to a logger that has none yet.
+    
+    Loggers share one console and one file handler, fed through a single
+    queue and written by one listener thread, so records from all modules
+    reach the log file in order. A logger given its own log_file or
+    log_format gets its own handlers instead.
+    
+    Args:
+        logger: Logger to configure
+        level: Logging level override
+        log_file: Log file path override
+        log_format: Log format override
+        
+    Returns:
+        Configured logger instance
+    """
+    global _shared_handlers, _queue_listener
+    
+    with _setup_lock:
+        # Another thread may have configured the logger while this one waited
+        if logger.handlers:
+            return logger
+        
+        log_config = _get_log_config()
+        
+        # Set logging level
+        log_level = level or log_config.get('level', 'INFO')
+        logger.setLevel(getattr(logging, log_level.upper()))
+        
+        shared_file = log_config.get('file', 'logs/conversion.log')
+        shared_format = log_config.get(
+            'format', 
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        
+        if (log_file and log_file != shared_file) or (log_format and log_format != shared_format):
+            # A logger with its own output writes through its own handlers
+            for handler in _create_handlers(log_file or shared_file, log_format or shared_format):
+                logger.addHandler(handler)
+            return logger
+        
+        if _shared_handlers is None:
+            _shared_handlers = _create_handlers(shared_file, shared_format)
+        _shared_loggers.append(logger)
+        
+        if _log_directly:
+            for handler in _shared_handlers:
+                logger.addHandler(handler)
+            return logger
+        
+        # Records are queued by the logging thread and written by the background
+        # listener, so console and file I/O stay off the calling thread
+        logger.addHandler(_queue_handler)
+        if _queue_listener is None:
+            _queue_listener = logging.handlers.QueueListener(
+                _log_queue, *_shared_handlers, respect_handler_level=True
+            )
+            _queue_listener.start()
     
     return logger
 
@@ -92,7 +316,7 @@ def get_logger(name: str = __name__) -> logging.Logger:
     
     # Set up logger if not already configured
     if not logger.handlers:
-        return setup_logger(name)
+        return _configure_logger(logger)
     
     return logger
 
@@ -6,7 +6,11 @@ with proper formatting and error handling.
 """
 
 from typing import Dict, Any, Optional
-import json
+import logging
+import os
+import time
+import orjson
+import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from src.utils.config import config_manager
@@ -14,14 +18,44 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# orjson encodes numpy scalars/arrays natively, so the transformer no longer
+# needs to coerce them to Python types before writing. Non-string keys are
+# converted to strings, as the standard library encoder does
+ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Converters for types orjson does not encode natively, looked up by exact
+# type. Subclasses and other pandas types are resolved and added on first use
+JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    pd.Timestamp: pd.Timestamp.isoformat,
+    type(pd.NA): str
+}
+
+# Output files are written through a 1 MiB buffer so the small framing writes
+# of the streamed combined file are coalesced into few write syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows encoded at a time when streaming table records into the combined file
+COMBINED_CHUNK_ROWS = 1000
+
 
 class JSONWriter:
     """Handles writing data to JSON files."""
     
+    # Directories already created (or found to exist) by any writer
+    _ensured_dirs = set()
+    
     def __init__(self):
         """Initialize JSONWriter."""
         self.config = config_manager
         self.write_stats = {}
+        # Running totals over write_stats, kept up to date by _record_write
+        self._total_bytes = 0
+        self._total_records = 0
+        self._total_duration = 0.0
+        # Output settings are resolved on first use and then reused
+        self._base_prefix = None
+        self._combined_filename = None
     
     def write_table_json(self, data: Dict[str, Any], table_name: str, output_path: Optional[str] = None) -> str:
         """
@@ -44,41 +78,45 @@ class JSONWriter:
         output_path = Path(output_path)
         
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_path.parent)
         
-        logger.info(f"Writing {table_name} to {output_path}")
+        logger.info("Writing %s to %s", table_name, output_path)
         
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+            payload = orjson.dumps(data, default=self._json_serializer, option=ORJSON_OPTIONS)
+            with self._open_output(output_path) as f:
+                f.write(payload)
+                # The file position is the size, without another stat call
+                file_size = f.tell()
             
-            end_time = datetime.now()
-            write_duration = (end_time - start_time).total_seconds()
+            write_duration = time.perf_counter() - start_time
             
-            # Track write statistics
-            file_size = output_path.stat().st_size
-            record_count = len(data.get('data', []))
+            # Track write statistics (no throwaway default list when 'data' is present)
+            rows = data.get('data')
+            record_count = len(rows) if rows is not None else 0
             
-            self.write_stats[table_name] = {
+            self._record_write(table_name, {
                 'file_path': str(output_path),
                 'file_size_bytes': file_size,
                 'record_count': record_count,
                 'write_duration_seconds': write_duration,
-                'write_time': end_time.isoformat()
-            }
+                'write_time_epoch': time.time()  # Formatted in get_write_summary
+            })
             
-            logger.info(f"Successfully wrote {table_name}: {record_count} records, "
-                       f"{file_size:,} bytes, {write_duration:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                # The thousands separator needs format(), so skip it when INFO is off
+                logger.info("Successfully wrote %s: %s records, %s bytes, %.2fs",
+                            table_name, record_count, format(file_size, ','), write_duration)
             
             return str(output_path)
             
         except OSError as e:
-            logger.error(f"Failed to write {table_name} to {output_path}: {e}")
+            logger.error("Failed to write %s to %s: %s", table_name, output_path, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error writing {table_name}: {e}")
+            logger.error("Unexpected error writing %s: %s", table_name, e)
             raise
     
     def write_combined_json(self, combined_data: Dict[str, Any], output_path: Optional[str] = None) -> str:
@@ -98,43 +136,134 @@ class JSONWriter:
         output_path = Path(output_path)
         
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_path.parent)
         
-        logger.info(f"Writing combined dataset to {output_path}")
+        logger.info("Writing combined dataset to %s", output_path)
         
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+            with self._open_output(output_path) as f:
+                self._stream_combined_json(combined_data, f)
+                file_size = f.tell()
             
-            end_time = datetime.now()
-            write_duration = (end_time - start_time).total_seconds()
+            write_duration = time.perf_counter() - start_time
             
             # Track write statistics
-            file_size = output_path.stat().st_size
             total_records = combined_data.get('metadata', {}).get('total_records', 0)
             
-            self.write_stats['_combined'] = {
+            self._record_write('_combined', {
                 'file_path': str(output_path),
                 'file_size_bytes': file_size,
                 'record_count': total_records,
                 'write_duration_seconds': write_duration,
-                'write_time': end_time.isoformat()
-            }
+                'write_time_epoch': time.time()  # Formatted in get_write_summary
+            })
             
-            logger.info(f"Successfully wrote combined dataset: {total_records} records, "
-                       f"{file_size:,} bytes, {write_duration:.2f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully wrote combined dataset: %s records, %s bytes, %.2fs",
+                            total_records, format(file_size, ','), write_duration)
             
             return str(output_path)
             
         except OSError as e:
-            logger.error(f"Failed to write combined dataset to {output_path}: {e}")
+            logger.error("Failed to write combined dataset to %s: %s", output_path, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error writing combined dataset: {e}")
+            logger.error("Unexpected error writing combined dataset: %s", e)
             raise
     
+    def _record_write(self, file_name: str, stats: Dict[str, Any]):
+        """
+        Store write stats for a file and update the running totals.
+        
+        Args:
+            file_name: Table name, or '_combined' for the combined file
+            stats: Write statistics for the file
+        """
+        previous = self.write_stats.get(file_name)
+        if previous is not None:
+            # A rewritten file replaces its earlier stats
+            self._total_bytes -= previous['file_size_bytes']
+            self._total_records -= previous['record_count']
+            self._total_duration -= previous['write_duration_seconds']
+        
+        self.write_stats[file_name] = stats
+        self._total_bytes += stats['file_size_bytes']
+        self._total_records += stats['record_count']
+        self._total_duration += stats['write_duration_seconds']
+    
+    def _stream_combined_json(self, combined_data: Dict[str, Any], f) -> None:
+        """
+        Encode the combined dataset to an open binary file one table at a time.
+        
+        Only one table is encoded in memory at once instead of the whole dataset,
+        and the output has the same indented layout as encoding it in one go.
+        
+        Args:
+            combined_data: Combined dataset
+            f: File object opened in binary write mode
+        """
+        if not combined_data:
+            f.write(b'{}')
+            return
+        
+        f.write(b'{')
+        for i, (key, value) in enumerate(combined_data.items()):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(orjson.dumps(key) + b': ')
+            
+            if key == 'tables' and isinstance(value, dict) and value:
+                f.write(b'{')
+                for j, (table_name, records) in enumerate(value.items()):
+                    f.write(b',\n    ' if j else b'\n    ')
+                    f.write(orjson.dumps(table_name) + b': ')
+                    self._stream_records(records, f, level=2)
+                f.write(b'\n  }')
+            else:
+                f.write(self._encode_nested(value, level=1))
+        f.write(b'\n}')
+    
+    def _stream_records(self, records: Any, f, level: int) -> None:
+        """
+        Encode a table's record list to an open binary file in fixed-size chunks.
+        
+        Only one chunk of rows is encoded in memory at a time, and the output
+        matches encoding the whole list with _encode_nested.
+        
+        Args:
+            records: List of record dictionaries (other values are encoded whole)
+            f: File object opened in binary write mode
+            level: Nesting level of the list in the enclosing document
+        """
+        if not isinstance(records, list) or not records:
+            f.write(self._encode_nested(records, level))
+            return
+        
+        f.write(b'[')
+        for start in range(0, len(records), COMBINED_CHUNK_ROWS):
+            if start:
+                f.write(b',')
+            # Keep the chunk's items, dropping its '[' and its indented closing ']'
+            chunk = self._encode_nested(records[start:start + COMBINED_CHUNK_ROWS], level)
+            f.write(chunk[1:-(2 + 2 * level)])
+        f.write(b'\n' + b'  ' * level + b']')
+    
+    def _encode_nested(self, obj: Any, level: int) -> bytes:
+        """
+        Encode a value that is nested inside an indented JSON document.
+        
+        Args:
+            obj: Object to encode
+            level: Nesting level of the value in the enclosing document
+            
+        Returns:
+            Encoded bytes, re-indented to the given nesting level
+        """
+        payload = orjson.dumps(obj, default=self._json_serializer, option=ORJSON_OPTIONS)
+        # Encoded JSON strings never contain raw newlines, so every newline is layout
+        return payload.replace(b'\n', b'\n' + b'  ' * level)
+    
     def write_all_tables(self, transformed_data: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
         """
         Write all table data to individual JSON files.
@@ -147,21 +276,53 @@ class JSONWriter:
         """
         written_files = {}
         
-        logger.info(f"Writing {len(transformed_data)} tables to JSON files")
+        logger.info("Writing %s tables to JSON files", len(transformed_data))
         
         for table_name, table_data in transformed_data.items():
             try:
                 file_path = self.write_table_json(table_data, table_name)
                 written_files[table_name] = file_path
-                logger.info(f"✅ Successfully wrote {table_name}")
+                logger.info("✅ Successfully wrote %s", table_name)
             except Exception as e:
-                logger.error(f"❌ Failed to write {table_name}: {e}")
+                logger.error("❌ Failed to write %s: %s", table_name, e)
                 # Continue with other tables
                 continue
         
-        logger.info(f"Successfully wrote {len(written_files)} out of {len(transformed_data)} tables")
+        logger.info("Successfully wrote %s out of %s tables", len(written_files), len(transformed_data))
         return written_files
     
+    def _open_output(self, output_path: Path):
+        """
+        Open an output file for binary writing through the write buffer.
+        
+        The ensured-directory cache is not invalidated when a directory is
+        removed, so if the directory is missing it is dropped from the cache,
+        created again and the open is retried once.
+        
+        Args:
+            output_path: Output file path
+            
+        Returns:
+            File object opened in binary write mode
+        """
+        try:
+            return open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        except FileNotFoundError:
+            JSONWriter._ensured_dirs.discard(output_path.parent)
+            self._ensure_dir(output_path.parent)
+            return open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+    
+    def _ensure_dir(self, directory: Path):
+        """
+        Create a directory (and parents) unless it was already ensured.
+        
+        Args:
+            directory: Directory that must exist
+        """
+        if directory not in JSONWriter._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            JSONWriter._ensured_dirs.add(directory)
+    
     def _get_table_output_path(self, table_name: str) -> str:
         """
         Get output path for a table JSON file.
@@ -172,8 +333,7 @@ class JSONWriter:
         Returns:
             Output file path
         """
-        base_path = self.config.get_setting('output.base_path', 'data/output')
-        return str(Path(base_path) / f"{table_name}.json")
+        return f"{self._get_base_prefix()}{table_name}.json"
     
     def _get_combined_output_path(self) -> str:
         """
@@ -182,9 +342,26 @@ class JSONWriter:
         Returns:
             Output file path for combined data
         """
-        base_path = self.config.get_setting('output.base_path', 'data/output')
-        filename = self.config.get_setting('output.combined_filename', 'retail_db_combined.json')
-        return str(Path(base_path) / filename)
+        if self._combined_filename is None:
+            self._combined_filename = self.config.get_setting('output.combined_filename', 'retail_db_combined.json')
+        
+        return f"{self._get_base_prefix()}{self._combined_filename}"
+    
+    def _get_base_prefix(self) -> str:
+        """
+        Get the output directory from configuration as a path prefix.
+        
+        Output paths are built by string concatenation rather than a Path
+        object per file.
+        
+        Returns:
+            Normalized output base path ending in a path separator
+        """
+        if self._base_prefix is None:
+            base_path = Path(self.config.get_setting('output.base_path', 'data/output'))
+            self._base_prefix = os.path.join(os.fspath(base_path), '')
+        
+        return self._base_prefix
     
     def _json_serializer(self, obj):
         """
@@ -196,15 +373,23 @@ class JSONWriter:
         Returns:
             JSON-serializable representation
         """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, 'item'):  # numpy/pandas scalars
-            return obj.item()
-        elif str(type(obj)).startswith('<class \'pandas'):
-            # Handle any remaining pandas types
-            return str(obj)
-        
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        # numpy scalars and arrays are encoded natively (OPT_SERIALIZE_NUMPY)
+        obj_type = type(obj)
+        convert = JSON_CONVERTERS.get(obj_type)
+        
+        if convert is None:
+            if isinstance(obj, datetime):
+                convert = obj_type.isoformat
+            elif obj_type.__module__.startswith('pandas'):
+                # Handle any remaining pandas types
+                convert = str
+            else:
+                raise TypeError(f"Object of type {obj_type} is not JSON serializable")
+            
+            # Later objects of this type skip the checks above
+            JSON_CONVERTERS[obj_type] = convert
+        
+        return convert(obj)
     
     def get_write_summary(self) -> Dict[str, Any]:
         """
@@ -218,9 +403,9 @@ class JSONWriter:
         
         summary = {
             'files_written': len(self.write_stats),
-            'total_size_bytes': sum(stats['file_size_bytes'] for stats in self.write_stats.values()),
-            'total_records': sum(stats['record_count'] for stats in self.write_stats.values()),
-            'total_duration_seconds': sum(stats['write_duration_seconds'] for stats in self.write_stats.values()),
+            'total_size_bytes': self._total_bytes,
+            'total_records': self._total_records,
+            'total_duration_seconds': self._total_duration,
             'files': {}
         }
         
@@ -229,7 +414,8 @@ class JSONWriter:
                 'size_bytes': stats['file_size_bytes'],
                 'records': stats['record_count'],
                 'duration_seconds': stats['write_duration_seconds'],
-                'path': stats['file_path']
+                'path': stats['file_path'],
+                'write_time': datetime.fromtimestamp(stats['write_time_epoch']).isoformat()
             }
         
         return summary
@@ -274,19 +460,29 @@ class JSONWriter:
                 # Check if file exists and is readable
                 if not file_path.exists():
                     validation_results[file_name] = False
-                    logger.error(f"Output file not found: {file_path}")
+                    logger.error("Output file not found: %s", file_path)
                     continue
                 
-                # Try to read and parse JSON
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                # Check the document's opening and closing bytes instead of
+                # parsing the whole file; the writer only emits complete documents
+                with open(file_path, 'rb') as f:
+                    head = f.read(1)
+                    tail = b''
+                    if head:
+                        f.seek(-1, os.SEEK_END)
+                        tail = f.read(1)
+                
+                if head + tail not in (b'{}', b'[]'):
+                    validation_results[file_name] = False
+                    logger.error("Output file is not a complete JSON document: %s", file_path)
+                    continue
                 
                 validation_results[file_name] = True
-                logger.debug(f"Output file validation passed: {file_path}")
+                logger.debug("Output file validation passed: %s", file_path)
                 
             except Exception as e:
                 validation_results[file_name] = False
-                logger.error(f"Output file validation failed for {file_path}: {e}")
+                logger.error("Output file validation failed for %s: %s", file_path, e)
         
         return validation_results
 
@@ -0,0 +1,58 @@
+"""
+Tests for CSV reading utilities.
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.readers.csv_reader import csv_reader
+
+# pandas' default NA markers, which read_csv treated as nulls
+PANDAS_NA_MARKERS = [
+    '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+
+class ReadCSVNullValuesTest(unittest.TestCase):
+    """Checks that missing-value markers are read as nulls."""
+    
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def write_orders(self, lines):
+        """
+        Write order rows (no header) to the temporary CSV file.
+        
+        Args:
+            lines: CSV lines without line terminators
+        """
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+    
+    def test_pandas_default_na_markers(self):
+        self.write_orders([f"{i},{marker},{marker},{marker}" for i, marker in enumerate(PANDAS_NA_MARKERS)])
+        
+        df = csv_reader.read_csv_file('orders', self.path)
+        
+        self.assertEqual(len(df), len(PANDAS_NA_MARKERS))
+        for col in ['order_date', 'order_customer_id', 'order_status']:
+            self.assertEqual(df[col].isna().sum(), len(PANDAS_NA_MARKERS), col)
+    
+    def test_values_are_kept(self):
+        self.write_orders(['1,2013-07-25 00:00:00.0,11599,CLOSED', '2,NAN,256,NONE'])
+        
+        df = csv_reader.read_csv_file('orders', self.path)
+        
+        self.assertEqual(df['order_customer_id'].tolist(), [11599, 256])
+        self.assertEqual(df['order_status'].tolist(), ['CLOSED', 'NONE'])
+        self.assertEqual(df['order_date'].tolist(), ['2013-07-25 00:00:00.0', 'NAN'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""
+Tests for data validation utilities.
+"""
+
+import unittest
+
+from src.processors.data_validator import DataValidator
+from src.readers.csv_reader import csv_reader
+
+
+class ChunkedValidationTest(unittest.TestCase):
+    """Checks that validating a table chunk by chunk matches validating it whole."""
+    
+    def test_chunked_matches_whole_table(self):
+        validator = DataValidator()
+        expected = validator.validate_dataframe(csv_reader.read_csv_file('orders'), 'orders')
+        
+        chunk_count = 0
+        for chunk in csv_reader.iter_chunks('orders', chunksize=10000):
+            validator.update(chunk, 'orders')
+            chunk_count += 1
+        
+        self.assertGreater(chunk_count, 1)
+        self.assertEqual(validator.finalize('orders'), expected)
+    
+    def test_default_chunk_size(self):
+        chunks = list(csv_reader.iter_chunks('orders'))
+        
+        self.assertEqual(len(chunks[0]), csv_reader.config.get_setting('processing.chunk_size'))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(csv_reader.read_csv_file('orders')))
+
+
+if __name__ == '__main__':
+    unittest.main()
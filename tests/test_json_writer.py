@@ -0,0 +1,81 @@
+"""
+Tests for JSON writing utilities.
+
+The combined dataset is streamed to disk in chunks by splicing orjson's
+indented output, so these tests check that the streamed bytes match encoding
+the whole document in one call.
+"""
+
+import io
+import unittest
+
+import orjson
+
+from src.writers.json_writer import json_writer, ORJSON_OPTIONS, COMBINED_CHUNK_ROWS
+
+
+def make_records(count):
+    """
+    Build simple table records.
+    
+    Args:
+        count: Number of records
+    
+    Returns:
+        List of record dictionaries
+    """
+    return [{'id': i, 'name': f"row {i}", 'price': i * 0.5, 'note': None} for i in range(count)]
+
+
+class StreamCombinedJSONTest(unittest.TestCase):
+    """Checks _stream_combined_json against a one-shot orjson encode."""
+    
+    def assert_streams_like_dumps(self, combined_data):
+        """
+        Assert that streaming a dataset gives the same bytes as orjson.dumps.
+        
+        Args:
+            combined_data: Combined dataset to encode
+        """
+        stream = io.BytesIO()
+        json_writer._stream_combined_json(combined_data, stream)
+        
+        expected = orjson.dumps(combined_data, option=ORJSON_OPTIONS)
+        self.assertEqual(stream.getvalue(), expected)
+    
+    def test_empty_dataset(self):
+        self.assert_streams_like_dumps({})
+    
+    def test_empty_tables(self):
+        self.assert_streams_like_dumps({'metadata': {'table_count': 0}, 'tables': {}})
+        self.assert_streams_like_dumps({'tables': {'orders': [], 'products': []}})
+    
+    def test_single_partial_chunk(self):
+        self.assert_streams_like_dumps({'tables': {'orders': make_records(3)}})
+    
+    def test_several_chunks(self):
+        self.assert_streams_like_dumps({
+            'metadata': {'dataset_name': 'retail_db_combined', 'tables': {'orders': {'record_count': 1}}},
+            'tables': {
+                'orders': make_records(2 * COMBINED_CHUNK_ROWS + 7),
+                'products': make_records(COMBINED_CHUNK_ROWS)
+            }
+        })
+    
+    def test_non_list_values(self):
+        self.assert_streams_like_dumps({
+            'tables': {'orders': {'id': 1}, 'products': None, 'categories': 'none', 'departments': 3},
+            'count': 4
+        })
+        self.assert_streams_like_dumps({'tables': [make_records(2)]})
+    
+    def test_strings_with_newlines(self):
+        records = [{'id': i, 'description': f"line one\nline two\r\n  {i}"} for i in range(COMBINED_CHUNK_ROWS + 1)]
+        self.assert_streams_like_dumps({
+            'metadata': {'note': "first\nsecond"},
+            'tables': {"multi\nline": records}
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
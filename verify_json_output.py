@@ -6,15 +6,15 @@ This script validates the generated JSON files and provides sample data
 to verify the conversion quality.
 """
 
-import json
 import os
+import orjson
 from pathlib import Path
 
 def load_json_file(filepath):
     """Load and return JSON data from file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        with open(filepath, 'rb') as file:
+            return orjson.loads(file.read())
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return None
@@ -43,10 +43,14 @@ def verify_json_output():
     
     total_records = 0
     
+    # Scan the directory once; DirEntry caches its stat result
+    entries = {entry.name: entry for entry in os.scandir(output_dir)}
+    
     for filename in expected_files:
         filepath = output_dir / filename
+        entry = entries.get(filename)
         
-        if not filepath.exists():
+        if entry is None:
             print(f"❌ Missing: {filename}")
             continue
             
@@ -58,7 +62,7 @@ def verify_json_output():
             continue
             
         # File size
-        file_size = filepath.stat().st_size
+        file_size = entry.stat().st_size
         size_str = format_file_size(file_size)
         
         if filename == "retail_db_combined.json":